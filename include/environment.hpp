@@ -24,8 +24,6 @@ struct Environment {
     bool assign(const std::string &name, Value value);
     /// lookup name value, searching outward, returns nullptr if undefined
     const Value *get(const std::string &name) const;
-    /// true if name exists in the current scope only
-    bool has_local(const std::string &name) const;
 
     /// map of identifiers and their respective values for a given scope
     std::unordered_map<std::string, Value> values;
@@ -67,9 +67,9 @@ class Interpreter {
     Value value_from_literal(const Literal &literal) const;
 
     /// validate bool values and report type errors
-    bool expect_bool(const Value &value, const Span &span, const std::string &context);
+    bool expect_bool(const Value &value, const Span &span, const char *context);
     /// validate int values and report type errors
-    int expect_number(const Value &value, const Span &span, const std::string &context);
+    int expect_number(const Value &value, const Span &span, const char *context);
     /// compare values for equality
     bool values_equal(const Value &left, const Value &right) const;
     /// type name for error messages
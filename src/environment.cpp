@@ -7,12 +7,8 @@ namespace interpreter_detail {
 Environment::Environment(std::shared_ptr<Environment> enclosing_env) : enclosing(std::move(enclosing_env)) {}
 
 bool Environment::define(const std::string &name, Value value) {
-    // check if variable has already been declared
-    if (has_local(name)) {
-        return false;
-    }
-    values[name] = std::move(value); // add to map of definitions
-    return true;
+    // add to map of definitions, fails if variable has already been declared (single hash lookup)
+    return values.try_emplace(name, std::move(value)).second;
 }
 
 bool Environment::assign(const std::string &name, Value value) {
@@ -39,8 +35,4 @@ const Value *Environment::get(const std::string &name) const {
     }
     return nullptr; // value not found
 }
-
-bool Environment::has_local(const std::string &name) const {
-    return values.find(name) != values.end(); // check local scope
-}
 } // namespace interpreter_detail
@@ -355,7 +355,7 @@ Interpreter::Value Interpreter::evaluate_call(const CallExpr &expr, const Span &
     // bind parameters in a new environment connected to the closure
     std::shared_ptr<Environment> call_env = std::make_shared<Environment>(std::move(closure));
     for (std::size_t i = 0; i < params.size(); ++i) {
-        if (!call_env->define(params[i].text, arguments[i])) { // define parameters in new environment if not already defined
+        if (!call_env->define(params[i].text, std::move(arguments[i]))) { // define parameters in new environment if not already defined
             runtime_error(params[i].span, "Duplicate parameter name '" + params[i].text + "'.");
         }
     }
@@ -388,21 +388,21 @@ Interpreter::Value Interpreter::value_from_literal(const Literal &literal) const
     }
 }
 
-bool Interpreter::expect_bool(const Value &value, const Span &span, const std::string &context) {
+bool Interpreter::expect_bool(const Value &value, const Span &span, const char *context) {
     // type check for boolean contexts
     if (std::holds_alternative<bool>(value)) {
         return std::get<bool>(value);
     }
-    runtime_error(span, "Expected boolean in " + context + ", got " + std::string(value_type_name(value)) + ".");
+    runtime_error(span, std::string("Expected boolean in ") + context + ", got " + value_type_name(value) + ".");
     return false;
 }
 
-int Interpreter::expect_number(const Value &value, const Span &span, const std::string &context) {
+int Interpreter::expect_number(const Value &value, const Span &span, const char *context) {
     // type check for numeric contexts
     if (std::holds_alternative<int>(value)) {
         return std::get<int>(value);
     }
-    runtime_error(span, "Expected number in " + context + ", got " + std::string(value_type_name(value)) + ".");
+    runtime_error(span, std::string("Expected number in ") + context + ", got " + value_type_name(value) + ".");
     return 0;
 }
 
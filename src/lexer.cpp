@@ -1,8 +1,9 @@
 #include <unordered_map>
+#include <utility>
 
 #include "lexer.hpp"
 
-Lexer::Lexer(std::string source) : source_(source) {} // Store source string
+Lexer::Lexer(std::string source) : source_(std::move(source)) {} // Store source string
 
 std::vector<Token> Lexer::scan_tokens() {
     while (!is_at_end()) {
@@ -153,8 +154,8 @@ void Lexer::add_token(TokenType type, Literal literal) {
     span.start = start_;
     span.end = current_;
     span.pos = start_pos_;
-    std::string lexeme = source_.substr(start_, current_ - start_);   // slice text
-    tokens_.push_back(Token{type, lexeme, std::move(literal), span}); // add token to token vector
+    std::string lexeme = source_.substr(start_, current_ - start_);              // slice text
+    tokens_.push_back(Token{type, std::move(lexeme), std::move(literal), span}); // add token to token vector
 }
 
 void Lexer::add_error(const std::string &message, const SourcePos &pos) {
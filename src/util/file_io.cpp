@@ -1,14 +1,33 @@
+#include <filesystem>
 #include <fstream>
 #include <sstream>
+#include <system_error>
 
 #include "util/file_io.hpp"
 
 bool read_file(const std::string &path, std::string &out) {
     // Open file path
-    std::ifstream in(path);
+    std::ifstream in(path, std::ios::binary);
     if (!in) return false; // failed to open
 
-    // copy into string
+    // presize only when the size is known (regular, non-empty files)
+    std::error_code ec;
+    if (std::filesystem::is_regular_file(path, ec)) {
+        std::uintmax_t size = std::filesystem::file_size(path, ec);
+        if (!ec && size > 0 && size <= out.max_size()) {
+            out.resize(static_cast<std::size_t>(size));
+            in.read(out.data(), static_cast<std::streamsize>(size));
+            out.resize(static_cast<std::size_t>(in.gcount())); // file may have shrunk
+            if (in) {                                           // file may have grown
+                std::ostringstream rest;
+                rest << in.rdbuf();
+                out += rest.str();
+            }
+            return true;
+        }
+    }
+
+    // pipes, virtual files, etc. -> stream into buffer
     std::ostringstream buf;
     buf << in.rdbuf(); // Stream file into buffer
     out = buf.str();   // copy to output